@@ -7,9 +7,12 @@ No external dependencies.
 
 import json
 import os
+import re
 import shutil
 import sys
-import uuid
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, date, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -22,65 +25,128 @@ BACKUP_DIR = "backups"
 WEEKDAYS = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
 DATE_FMT = "%Y-%m-%d"
 DATETIME_FMT = "%Y-%m-%d %H:%M"
+TREE_BATCH = 100          # rows inserted per idle tick when filling Treeviews
+MAX_BACKUPS_SHOWN = 50    # newest backups listed in the nav
 
 # ---------- Storage ----------
+# Use orjson when available (much faster parse/serialize); fall back to the
+# stdlib so the app still has no hard external dependencies.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(o) -> bytes:
+        return orjson.dumps(o, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(o) -> bytes:
+        return json.dumps(o, indent=2).encode()
+
+# Parsed-data cache keyed on the file's mtime so repeated load_data() calls
+# (every screen render, plus per-subject helpers) don't re-read and re-parse
+# data.json. Callers that mutate the returned dict always call save_data()
+# straight after, which keeps the cached object in sync. Derived indexes
+# (parsed due dates) live alongside and are dropped whenever data changes.
+_cache = {"mtime": None, "data": None, "assignments_parsed": None, "assignments_by_due": None}
+
 def now_iso() -> str:
     return datetime.now().isoformat()
 
 def ensure_data_file():
     if not os.path.exists(DATA_FILE):
         init = {"subjects": [], "attendance": [], "assignments": [], "meta": {"createdAt": now_iso()}}
-        with open(DATA_FILE, "w") as f:
-            json.dump(init, f, indent=2)
+        with open(DATA_FILE, "wb") as f:
+            f.write(_dumps(init))
 
 def load_data() -> Dict[str, Any]:
     ensure_data_file()
-    with open(DATA_FILE, "r") as f:
-        return json.load(f)
+    st = os.stat(DATA_FILE)
+    if _cache["mtime"] == st.st_mtime_ns:
+        return _cache["data"]
+    with open(DATA_FILE, "rb") as f:
+        data = _loads(f.read())
+    _cache["mtime"] = st.st_mtime_ns
+    _cache["data"] = data
+    _cache["assignments_parsed"] = None
+    _cache["assignments_by_due"] = None
+    return data
 
 def save_data(d: Dict[str, Any]):
-    with open(DATA_FILE, "w") as f:
-        json.dump(d, f, indent=2)
+    # serialize once, write to a temp file, then atomically swap it in so a
+    # crash mid-write can never leave data.json half-written
+    payload = _dumps(d)
+    tmp = DATA_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, DATA_FILE)
+    _cache["mtime"] = os.stat(DATA_FILE).st_mtime_ns
+    _cache["data"] = d
+    _cache["assignments_parsed"] = None
+    _cache["assignments_by_due"] = None
 
 def backup_data() -> str:
     os.makedirs(BACKUP_DIR, exist_ok=True)
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     dest = os.path.join(BACKUP_DIR, f"data_backup_{ts}.json")
-    shutil.copy2(DATA_FILE, dest)
+    # hardlink when possible: zero bytes copied, and because save_data swaps
+    # in a fresh inode via os.replace the link stays a snapshot of the old
+    # contents. Fall back to a plain copy (cross-filesystem, Windows, etc.).
+    try:
+        os.link(DATA_FILE, dest)
+    except FileExistsError:
+        # second backup within the same timestamp; refresh it unless it is
+        # already a link to the current data (copying onto the shared inode
+        # would raise SameFileError)
+        if not os.path.samefile(DATA_FILE, dest):
+            tmp = dest + ".tmp"
+            shutil.copyfile(DATA_FILE, tmp)
+            os.replace(tmp, dest)
+    except OSError:
+        shutil.copyfile(DATA_FILE, dest)
     return dest
 
 def list_backups() -> List[str]:
     if not os.path.isdir(BACKUP_DIR):
         return []
-    files = sorted(os.listdir(BACKUP_DIR))
-    return [os.path.join(BACKUP_DIR, f) for f in files]
+    with os.scandir(BACKUP_DIR) as it:
+        return sorted(e.path for e in it if e.is_file())
 
 def gen_id() -> str:
-    return uuid.uuid4().hex[:10]
+    # same getrandom() syscall uuid4 ends up making, minus the UUID object
+    # construction; 10 hex chars of entropy as before
+    return os.urandom(5).hex()
 
 # ---------- Utilities ----------
+# one regex pass per piece replaces the chained split()s, the weekday
+# membership check, and the exception-as-control-flow parsing
+_SCHED_RE = re.compile(
+    r"^(?P<day>Sun|Mon|Tue|Wed|Thu|Fri|Sat)"
+    r"@(?P<start>\d{1,2}:\d{2})-(?P<end>\d{1,2}:\d{2})"
+    r"(?:\s+(?P<loc>.+))?$"
+)
+
 def parse_schedule_string(s: str) -> List[Dict[str, str]]:
     items = []
-    parts = [p.strip() for p in s.split(",") if p.strip()]
-    for p in parts:
-        loc = ""
-        if " " in p:
-            p, loc = p.split(" ", 1)
-            loc = loc.strip()
-        try:
-            day, times = p.split("@")
-            day = day.strip()
-            if day not in WEEKDAYS:
-                raise ValueError(f"Unknown weekday: {day}. Use one of: {', '.join(WEEKDAYS)}")
-            start, end = times.split("-")
-            items.append({"day": day, "start": start.strip(), "end": end.strip(), "location": loc})
-        except Exception:
+    for part in s.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        m = _SCHED_RE.match(part)
+        if not m:
             raise ValueError("Bad schedule piece. Example: Mon@09:00-10:30")
+        items.append({"day": m["day"], "start": m["start"], "end": m["end"], "location": m["loc"] or ""})
     return items
 
 def format_datetime_iso(s: Optional[str]) -> str:
     if not s:
         return "N/A"
+    return _format_datetime_cached(s)
+
+# dueAt strings repeat across renders, so cache the parse+strftime per string
+@lru_cache(maxsize=2048)
+def _format_datetime_cached(s: str) -> str:
     try:
         dt = datetime.fromisoformat(s)
         if dt.time().hour != 0 or dt.time().minute != 0 or dt.time().second != 0:
@@ -89,13 +155,59 @@ def format_datetime_iso(s: Optional[str]) -> str:
     except Exception:
         return s
 
-def compute_attendance_percent(subject_id: str) -> float:
-    d = load_data()
-    rows = [r for r in d.get("attendance", []) if r["subjectId"] == subject_id]
-    if not rows:
+def subjects_by_id(d: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return {s["id"]: s for s in d.get("subjects", [])}
+
+def _purge(coll: List[Dict[str, Any]], key: str, doomed: set) -> List[Dict[str, Any]]:
+    """Drop records whose `key` falls in the doomed id set; single pass with
+    O(1) membership tests, so bulk deletes cost the same as single ones."""
+    return [r for r in coll if r.get(key) not in doomed]
+
+def assignments_parsed(d: Dict[str, Any]) -> List[Tuple[Optional[datetime], Dict[str, Any]]]:
+    """(parsed dueAt, assignment) pairs; cached until data.json changes."""
+    if d is _cache["data"] and _cache["assignments_parsed"] is not None:
+        return _cache["assignments_parsed"]
+    parsed = []
+    for a in d.get("assignments", []):
+        due = None
+        if a.get("dueAt"):
+            try:
+                due = datetime.fromisoformat(a["dueAt"])
+            except Exception:
+                due = None
+        parsed.append((due, a))
+    if d is _cache["data"]:
+        _cache["assignments_parsed"] = parsed
+    return parsed
+
+def assignments_by_due(d: Dict[str, Any]) -> Tuple[List[datetime], List[Tuple[datetime, Dict[str, Any]]]]:
+    """Due-sorted (dueAt, assignment) pairs plus the bare key list for bisect;
+    assignments without a parseable dueAt are excluded. Cached with the data."""
+    if d is _cache["data"] and _cache["assignments_by_due"] is not None:
+        return _cache["assignments_by_due"]
+    pairs = sorted((p for p in assignments_parsed(d) if p[0]), key=lambda x: x[0])
+    index = ([due for due, _ in pairs], pairs)
+    if d is _cache["data"]:
+        _cache["assignments_by_due"] = index
+    return index
+
+def compute_all_attendance(d: Dict[str, Any]) -> Dict[str, List[int]]:
+    """One pass over attendance: {subject_id: [present_count, total]}."""
+    counts: Dict[str, List[int]] = {}
+    for r in d.get("attendance", []):
+        c = counts.setdefault(r["subjectId"], [0, 0])
+        c[0] += r["present"]
+        c[1] += 1
+    return counts
+
+def attendance_percent(counts: Dict[str, List[int]], subject_id: str) -> float:
+    present, total = counts.get(subject_id, (0, 0))
+    if total == 0:
         return 100.0
-    present = sum(1 for r in rows if r["present"])
-    return (present / len(rows)) * 100.0
+    return (present / total) * 100.0
+
+def compute_attendance_percent(subject_id: str) -> float:
+    return attendance_percent(compute_all_attendance(load_data()), subject_id)
 
 # ---------- GUI App ----------
 class PlannerApp(tk.Tk):
@@ -111,6 +223,13 @@ class PlannerApp(tk.Tk):
         self.right_frame = ttk.Frame(self)
         self.right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
+        self._backups_mtime = None
+        # last-loaded data, so click handlers don't even pay the os.stat that
+        # the module-level cache does; cleared by _save()
+        self._data = None
+        # file copies and JSON writes run here so they don't freeze the UI;
+        # completion is marshalled back to the Tk thread via self.after
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
         self._create_nav()
         self.content_widgets: Dict[str, tk.Widget] = {}
         self.current_screen = None
@@ -160,9 +279,19 @@ class PlannerApp(tk.Tk):
         self.content_widgets.clear()
 
     def _refresh_backups(self):
+        # skip the redraw entirely when the backups dir hasn't changed
+        try:
+            dir_mtime = os.stat(BACKUP_DIR).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if dir_mtime is not None and dir_mtime == self._backups_mtime:
+            return
+        self._backups_mtime = dir_mtime
         self.backup_listbox.delete(0, tk.END)
-        for b in list_backups():
-            self.backup_listbox.insert(tk.END, b)
+        # only the newest few are useful for restore; don't render hundreds
+        backups = list_backups()[-MAX_BACKUPS_SHOWN:]
+        if backups:
+            self.backup_listbox.insert(tk.END, *backups)
 
     def restore_selected_backup(self):
         sel = self.backup_listbox.curselection()
@@ -176,17 +305,51 @@ class PlannerApp(tk.Tk):
             return
         if messagebox.askyesno("Confirm Restore", f"Restore from {os.path.basename(path)}? This will replace current data."):
             backup_data()
-            shutil.copy2(path, DATA_FILE)
+            # swap in a fresh inode like save_data does; copying in place
+            # would write through the hardlink shared with the backup we
+            # just created and corrupt that snapshot
+            tmp = DATA_FILE + ".tmp"
+            shutil.copyfile(path, tmp)
+            os.replace(tmp, DATA_FILE)
+            self._data = None
             messagebox.showinfo("Restore", "Restore complete.")
             self._refresh_backups()
 
+    def _data_view(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = load_data()
+        return self._data
+
+    def _save(self, d: Dict[str, Any]):
+        save_data(d)
+        self._data = None
+
+    def _populate_tree_lazy(self, tree: ttk.Treeview, rows):
+        """Insert (iid, values) rows in batches: the first synchronously so the
+        screen appears populated, the rest on idle ticks so huge lists don't
+        block the event loop."""
+        it = iter(rows)
+
+        def insert_batch():
+            if not tree.winfo_exists():
+                return
+            for _ in range(TREE_BATCH):
+                try:
+                    iid, values = next(it)
+                except StopIteration:
+                    return
+                tree.insert("", tk.END, iid=iid, values=values)
+            self.after_idle(insert_batch)
+
+        insert_batch()
+
     # ---------- Screens ----------
     def show_dashboard(self):
         self._clear_right()
         frame = self.right_frame
         ttk.Label(frame, text="Dashboard", font=("TkDefaultFont", 16, "bold")).pack(anchor=tk.W, pady=(10,6), padx=10)
 
-        data = load_data()
+        data = self._data_view()
 
         # Today's classes
         today_frame = ttk.LabelFrame(frame, text="Today's classes")
@@ -205,19 +368,13 @@ class PlannerApp(tk.Tk):
         assign_frame = ttk.LabelFrame(frame, text="Upcoming assignments (7 days)")
         assign_frame.pack(fill=tk.X, padx=10, pady=6)
         now_dt = datetime.now()
-        upcoming = []
-        for a in data.get("assignments", []):
-            if a.get("dueAt"):
-                try:
-                    d = datetime.fromisoformat(a["dueAt"])
-                except Exception:
-                    continue
-                if now_dt <= d <= now_dt + timedelta(days=7):
-                    upcoming.append((d, a))
-        upcoming.sort(key=lambda x: x[0])
+        keys, pairs = assignments_by_due(data)
+        # index is due-sorted, so the 7-day window is a bisect slice
+        upcoming = pairs[bisect_left(keys, now_dt):bisect_right(keys, now_dt + timedelta(days=7))]
         if upcoming:
+            subj_by_id = subjects_by_id(data)
             for d, a in upcoming:
-                subj = next((s for s in data.get("subjects", []) if s["id"] == a.get("subjectId")), None)
+                subj = subj_by_id.get(a.get("subjectId"))
                 subj_name = subj["name"] if subj else "No subject"
                 ttk.Label(assign_frame, text=f"{a['title']} [{subj_name}] due {d.strftime(DATETIME_FMT)}").pack(anchor=tk.W, padx=8, pady=2)
         else:
@@ -226,9 +383,10 @@ class PlannerApp(tk.Tk):
         # attendance alerts
         attend_frame = ttk.LabelFrame(frame, text="Attendance alerts (<75%)")
         attend_frame.pack(fill=tk.X, padx=10, pady=6)
+        counts = compute_all_attendance(data)
         alerts = []
         for s in data.get("subjects", []):
-            pct = compute_attendance_percent(s["id"])
+            pct = attendance_percent(counts, s["id"])
             if pct < 75.0:
                 alerts.append((s, pct))
         if alerts:
@@ -242,7 +400,7 @@ class PlannerApp(tk.Tk):
         frame = self.right_frame
         ttk.Label(frame, text="Subjects", font=("TkDefaultFont", 16, "bold")).pack(anchor=tk.W, pady=(10,6), padx=10)
 
-        data = load_data()
+        data = self._data_view()
         cols = ("#1", "#2", "#3")
         tree = ttk.Treeview(frame, columns=cols, show="headings", selectmode="browse")
         tree.heading("#1", text="Name")
@@ -251,11 +409,12 @@ class PlannerApp(tk.Tk):
         tree.column("#1", width=260)
         tree.column("#2", width=80)
         tree.column("#3", width=180)
-        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
         self.content_widgets["subjects_tree"] = tree
 
-        for s in data.get("subjects", []):
-            tree.insert("", tk.END, iid=s["id"], values=(s["name"], s.get("code", ""), s.get("prof", "")))
+        # populate before packing so the widget is laid out once, not per insert
+        rows = ((s["id"], (s["name"], s.get("code", ""), s.get("prof", ""))) for s in data.get("subjects", []))
+        self._populate_tree_lazy(tree, rows)
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
 
         btn_frame = ttk.Frame(frame)
         btn_frame.pack(fill=tk.X, padx=10, pady=6)
@@ -265,100 +424,124 @@ class PlannerApp(tk.Tk):
         ttk.Button(btn_frame, text="View Schedule", command=self.view_subject_schedule).pack(side=tk.LEFT, padx=4)
 
     def add_subject_dialog(self):
-        d = simpledialog.Dialog(self, title="Add Subject")
-        # We'll use our own simple dialog with inputs via Toplevel because simpledialog.Dialog is abstract;
-        # implement using a custom Toplevel.
         self._subject_form(initial=None)
 
-    def _subject_form(self, initial: Optional[Dict[str, Any]]):
+    def _build_subject_form(self):
+        """Create the subject form Toplevel once; it is hidden on close and
+        reused, so reopening the dialog doesn't rebuild eight widgets."""
         top = tk.Toplevel(self)
         top.transient(self)
-        top.grab_set()
-        is_edit = bool(initial)
-        top.title("Edit Subject" if is_edit else "Add Subject")
         top.geometry("480x300")
+        top.protocol("WM_DELETE_WINDOW", self._subject_form_close)
+        self._subject_form_win = top
+
+        ttk.Label(top, text="Subject name:").pack(anchor=tk.W, padx=10, pady=(10,0))
+        self._sf_name = ttk.Entry(top)
+        self._sf_name.pack(fill=tk.X, padx=10)
+
+        ttk.Label(top, text="Code (optional):").pack(anchor=tk.W, padx=10, pady=(8,0))
+        self._sf_code = ttk.Entry(top)
+        self._sf_code.pack(fill=tk.X, padx=10)
+
+        ttk.Label(top, text="Professor (optional):").pack(anchor=tk.W, padx=10, pady=(8,0))
+        self._sf_prof = ttk.Entry(top)
+        self._sf_prof.pack(fill=tk.X, padx=10)
 
-        lbl_name = ttk.Label(top, text="Subject name:")
-        lbl_name.pack(anchor=tk.W, padx=10, pady=(10,0))
-        ent_name = ttk.Entry(top)
-        ent_name.pack(fill=tk.X, padx=10)
-
-        lbl_code = ttk.Label(top, text="Code (optional):")
-        lbl_code.pack(anchor=tk.W, padx=10, pady=(8,0))
-        ent_code = ttk.Entry(top)
-        ent_code.pack(fill=tk.X, padx=10)
-
-        lbl_prof = ttk.Label(top, text="Professor (optional):")
-        lbl_prof.pack(anchor=tk.W, padx=10, pady=(8,0))
-        ent_prof = ttk.Entry(top)
-        ent_prof.pack(fill=tk.X, padx=10)
-
-        lbl_sched = ttk.Label(top, text="Schedule (comma separated, e.g. Mon@09:00-10:30,Tue@11:00-12:30 Room201):")
-        lbl_sched.pack(anchor=tk.W, padx=10, pady=(8,0))
-        ent_sched = ttk.Entry(top)
-        ent_sched.pack(fill=tk.X, padx=10)
-
-        if initial:
-            ent_name.insert(0, initial.get("name", ""))
-            ent_code.insert(0, initial.get("code", ""))
-            ent_prof.insert(0, initial.get("prof", ""))
+        ttk.Label(top, text="Schedule (comma separated, e.g. Mon@09:00-10:30,Tue@11:00-12:30 Room201):").pack(anchor=tk.W, padx=10, pady=(8,0))
+        self._sf_sched = ttk.Entry(top)
+        self._sf_sched.pack(fill=tk.X, padx=10)
+
+        btn_frame = ttk.Frame(top)
+        btn_frame.pack(fill=tk.X, padx=10, pady=12)
+        ttk.Button(btn_frame, text="Save", command=self._subject_form_save).pack(side=tk.LEFT, padx=6)
+        ttk.Button(btn_frame, text="Cancel", command=self._subject_form_close).pack(side=tk.LEFT, padx=6)
+
+    def _subject_form(self, initial: Optional[Dict[str, Any]]):
+        top = getattr(self, "_subject_form_win", None)
+        if top is None or not top.winfo_exists():
+            self._build_subject_form()
+            top = self._subject_form_win
+        self._sf_initial = initial
+        top.title("Edit Subject" if initial else "Add Subject")
+
+        for ent, key in ((self._sf_name, "name"), (self._sf_code, "code"), (self._sf_prof, "prof")):
+            ent.delete(0, tk.END)
+            if initial:
+                ent.insert(0, initial.get(key, ""))
+        self._sf_sched.delete(0, tk.END)
+        if initial and initial.get("schedule"):
             # show schedule as original format if present
-            if initial.get("schedule"):
-                parts = []
-                for sch in initial["schedule"]:
-                    part = f"{sch['day']}@{sch['start']}-{sch['end']}"
-                    if sch.get("location"):
-                        part += " " + sch["location"]
-                    parts.append(part)
-                ent_sched.insert(0, ",".join(parts))
-
-        def on_save():
-            name = ent_name.get().strip()
-            if not name:
-                messagebox.showerror("Validation", "Name cannot be empty.")
+            parts = []
+            for sch in initial["schedule"]:
+                part = f"{sch['day']}@{sch['start']}-{sch['end']}"
+                if sch.get("location"):
+                    part += " " + sch["location"]
+                parts.append(part)
+            self._sf_sched.insert(0, ",".join(parts))
+
+        top.deiconify()
+        top.grab_set()
+        self._sf_name.focus_set()
+
+    def _subject_form_close(self):
+        # hide instead of destroy so the widgets survive for the next open
+        self._subject_form_win.grab_release()
+        self._subject_form_win.withdraw()
+
+    def _subject_form_save(self):
+        initial = self._sf_initial
+        is_edit = bool(initial)
+        name = self._sf_name.get().strip()
+        if not name:
+            messagebox.showerror("Validation", "Name cannot be empty.")
+            return
+        code = self._sf_code.get().strip()
+        prof = self._sf_prof.get().strip()
+        schedule_raw = self._sf_sched.get().strip()
+        schedule = []
+        if schedule_raw:
+            try:
+                schedule = parse_schedule_string(schedule_raw)
+            except Exception as e:
+                messagebox.showerror("Schedule", f"Error parsing schedule: {e}")
                 return
-            code = ent_code.get().strip()
-            prof = ent_prof.get().strip()
-            schedule_raw = ent_sched.get().strip()
-            schedule = []
-            if schedule_raw:
-                try:
-                    schedule = parse_schedule_string(schedule_raw)
-                except Exception as e:
-                    messagebox.showerror("Schedule", f"Error parsing schedule: {e}")
-                    return
-            data = load_data()
-            if is_edit and initial:
-                # mutate existing subject
-                for s in data.get("subjects", []):
-                    if s["id"] == initial["id"]:
-                        s["name"] = name
-                        s["code"] = code
-                        s["prof"] = prof
-                        s["schedule"] = schedule
-                        break
-                save_data(data)
-                messagebox.showinfo("Edit", "Subject updated.")
+        data = self._data_view()
+        if is_edit:
+            # mutate existing subject
+            subj_id = initial["id"]
+            for s in data.get("subjects", []):
+                if s["id"] == subj_id:
+                    s["name"] = name
+                    s["code"] = code
+                    s["prof"] = prof
+                    s["schedule"] = schedule
+                    break
+            self._save(data)
+            messagebox.showinfo("Edit", "Subject updated.")
+        else:
+            subj_id = gen_id()
+            subj = {
+                "id": subj_id,
+                "name": name,
+                "code": code,
+                "prof": prof,
+                "schedule": schedule,
+                "createdAt": now_iso()
+            }
+            data["subjects"].append(subj)
+            self._save(data)
+            messagebox.showinfo("Add", "Subject added.")
+        self._subject_form_close()
+        # touch just the affected row when the Subjects screen is open
+        tree = self.content_widgets.get("subjects_tree")
+        if tree is not None and tree.winfo_exists():
+            if is_edit:
+                tree.item(subj_id, values=(name, code, prof))
             else:
-                subj = {
-                    "id": gen_id(),
-                    "name": name,
-                    "code": code,
-                    "prof": prof,
-                    "schedule": schedule,
-                    "createdAt": now_iso()
-                }
-                data["subjects"].append(subj)
-                save_data(data)
-                messagebox.showinfo("Add", "Subject added.")
-            top.destroy()
+                tree.insert("", tk.END, iid=subj_id, values=(name, code, prof))
+        else:
             self.show_subjects()
 
-        btn_frame = ttk.Frame(top)
-        btn_frame.pack(fill=tk.X, padx=10, pady=12)
-        ttk.Button(btn_frame, text="Save", command=on_save).pack(side=tk.LEFT, padx=6)
-        ttk.Button(btn_frame, text="Cancel", command=top.destroy).pack(side=tk.LEFT, padx=6)
-
     def edit_subject_dialog(self):
         tree: ttk.Treeview = self.content_widgets.get("subjects_tree")  # type: ignore
         if not tree:
@@ -369,7 +552,7 @@ class PlannerApp(tk.Tk):
             messagebox.showinfo("Edit Subject", "Select a subject to edit.")
             return
         subj_id = sel[0]
-        data = load_data()
+        data = self._data_view()
         subj = next((s for s in data.get("subjects", []) if s["id"] == subj_id), None)
         if not subj:
             messagebox.showerror("Edit Subject", "Subject not found.")
@@ -386,18 +569,20 @@ class PlannerApp(tk.Tk):
             messagebox.showinfo("Delete Subject", "Select a subject to delete.")
             return
         subj_id = sel[0]
-        data = load_data()
+        data = self._data_view()
         subj = next((s for s in data.get("subjects", []) if s["id"] == subj_id), None)
         if not subj:
             messagebox.showerror("Delete Subject", "Subject not found.")
             return
         if messagebox.askyesno("Confirm", f"Delete subject '{subj['name']}' and all related attendance/assignments?"):
-            data["subjects"] = [x for x in data.get("subjects", []) if x["id"] != subj_id]
-            data["attendance"] = [r for r in data.get("attendance", []) if r.get("subjectId") != subj_id]
-            data["assignments"] = [a for a in data.get("assignments", []) if a.get("subjectId") != subj_id]
-            save_data(data)
+            subjects = data.get("subjects", [])
+            del subjects[next(i for i, x in enumerate(subjects) if x["id"] == subj_id)]
+            doomed = {subj_id}
+            data["attendance"] = _purge(data.get("attendance", []), "subjectId", doomed)
+            data["assignments"] = _purge(data.get("assignments", []), "subjectId", doomed)
+            self._save(data)
+            tree.delete(subj_id)
             messagebox.showinfo("Delete", "Deleted subject and related records.")
-            self.show_subjects()
 
     def view_subject_schedule(self):
         tree: ttk.Treeview = self.content_widgets.get("subjects_tree")  # type: ignore
@@ -409,7 +594,7 @@ class PlannerApp(tk.Tk):
             messagebox.showinfo("View Schedule", "Select a subject first.")
             return
         subj_id = sel[0]
-        data = load_data()
+        data = self._data_view()
         subj = next((s for s in data.get("subjects", []) if s["id"] == subj_id), None)
         if not subj:
             messagebox.showerror("View Schedule", "Subject not found.")
@@ -423,25 +608,67 @@ class PlannerApp(tk.Tk):
             msg += "No schedule set."
         messagebox.showinfo("Schedule", msg)
 
+    def _choose_subject_dialog(self, title: str, subs: List[Dict[str, Any]], allow_none: bool = False) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Modal subject picker backed by a readonly Combobox.
+
+        Returns (ok, subject); ok is False when the dialog was cancelled and
+        subject is None when '(no subject)' was picked (allow_none only).
+        """
+        top = tk.Toplevel(self)
+        top.transient(self)
+        top.grab_set()
+        top.title(title)
+
+        ttk.Label(top, text="Subject:").pack(anchor=tk.W, padx=10, pady=(10, 0))
+        names = [s["name"] for s in subs]
+        if allow_none:
+            names = ["(no subject)"] + names
+        box = ttk.Combobox(top, values=names, state="readonly")
+        box.current(0)
+        box.pack(fill=tk.X, padx=10, pady=4)
+
+        result: Dict[str, Any] = {"ok": False, "subj": None}
+
+        def on_ok():
+            idx = box.current()
+            if allow_none:
+                idx -= 1
+            result["ok"] = True
+            result["subj"] = subs[idx] if idx >= 0 else None
+            top.destroy()
+
+        btn_frame = ttk.Frame(top)
+        btn_frame.pack(fill=tk.X, padx=10, pady=10)
+        ttk.Button(btn_frame, text="OK", command=on_ok).pack(side=tk.LEFT, padx=6)
+        ttk.Button(btn_frame, text="Cancel", command=top.destroy).pack(side=tk.LEFT, padx=6)
+        self.wait_window(top)
+        return result["ok"], result["subj"]
+
     # ---------- Attendance ----------
     def show_attendance(self):
         self._clear_right()
         frame = self.right_frame
         ttk.Label(frame, text="Attendance", font=("TkDefaultFont", 16, "bold")).pack(anchor=tk.W, pady=(10,6), padx=10)
 
-        data = load_data()
+        data = self._data_view()
         cols = ("#1", "#2", "#3")
         tree = ttk.Treeview(frame, columns=cols, show="headings", selectmode="browse")
         tree.heading("#1", text="Subject")
         tree.heading("#2", text="Date")
         tree.heading("#3", text="Present")
-        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
         self.content_widgets["attendance_tree"] = tree
 
-        for r in data.get("attendance", []):
-            subj = next((s for s in data.get("subjects", []) if s["id"] == r["subjectId"]), None)
-            subj_name = subj["name"] if subj else "Unknown"
-            tree.insert("", tk.END, iid=r["id"], values=(subj_name, r["date"], "Yes" if r["present"] else "No"))
+        # populate before packing so the widget is laid out once, not per insert
+        subj_by_id = subjects_by_id(data)
+
+        def attendance_rows():
+            for r in data.get("attendance", []):
+                subj = subj_by_id.get(r["subjectId"])
+                subj_name = subj["name"] if subj else "Unknown"
+                yield r["id"], (subj_name, r["date"], "Yes" if r["present"] else "No")
+
+        self._populate_tree_lazy(tree, attendance_rows())
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
 
         btn_frame = ttk.Frame(frame)
         btn_frame.pack(fill=tk.X, padx=10, pady=6)
@@ -451,23 +678,14 @@ class PlannerApp(tk.Tk):
 
     def record_attendance_dialog(self):
         # choose subject then date and present Y/N
-        data = load_data()
+        data = self._data_view()
         subs = data.get("subjects", [])
         if not subs:
             messagebox.showinfo("Record Attendance", "No subjects present. Add subjects first.")
             return
-        choices = [f"{i+1}. {s['name']}" for i, s in enumerate(subs)]
-        sel = simpledialog.askstring("Record Attendance", "Select subject number:\n" + "\n".join(choices))
-        if not sel:
-            return
-        if not sel.isdigit():
-            messagebox.showerror("Input", "Invalid input.")
+        ok, subj = self._choose_subject_dialog("Record Attendance", subs)
+        if not ok or subj is None:
             return
-        n = int(sel)
-        if n < 1 or n > len(subs):
-            messagebox.showerror("Input", "Number out of range.")
-            return
-        subj = subs[n - 1]
         dt_in = simpledialog.askstring("Date", f"Date (YYYY-MM-DD) [default {date.today().isoformat()}]:")
         if dt_in:
             try:
@@ -481,9 +699,13 @@ class PlannerApp(tk.Tk):
         present = True if (present_raw is None or present_raw.strip().lower() in ("", "y", "yes")) else False
         rec = {"id": gen_id(), "subjectId": subj["id"], "date": d.isoformat(), "present": present, "createdAt": now_iso()}
         data.setdefault("attendance", []).append(rec)
-        save_data(data)
+        self._save(data)
         messagebox.showinfo("Attendance", f"Recorded {'Present' if present else 'Absent'} for {subj['name']} on {d.isoformat()}")
-        self.show_attendance()
+        tree = self.content_widgets.get("attendance_tree")
+        if tree is not None and tree.winfo_exists():
+            tree.insert("", tk.END, iid=rec["id"], values=(subj["name"], rec["date"], "Yes" if present else "No"))
+        else:
+            self.show_attendance()
 
     def delete_attendance_entry(self):
         tree: ttk.Treeview = self.content_widgets.get("attendance_tree")  # type: ignore
@@ -495,26 +717,28 @@ class PlannerApp(tk.Tk):
             messagebox.showinfo("Delete Attendance", "Select an entry to delete.")
             return
         entry_id = sel[0]
-        data = load_data()
-        rec = next((r for r in data.get("attendance", []) if r["id"] == entry_id), None)
-        if not rec:
+        data = self._data_view()
+        rows = data.get("attendance", [])
+        idx = next((i for i, r in enumerate(rows) if r["id"] == entry_id), None)
+        if idx is None:
             messagebox.showerror("Delete", "Entry not found.")
             return
         if messagebox.askyesno("Confirm", "Delete selected attendance entry?"):
-            data["attendance"] = [r for r in data.get("attendance", []) if r["id"] != entry_id]
-            save_data(data)
+            del rows[idx]
+            self._save(data)
+            tree.delete(entry_id)
             messagebox.showinfo("Delete", "Deleted.")
-            self.show_attendance()
 
     def attendance_report(self):
-        data = load_data()
+        data = self._data_view()
         subs = data.get("subjects", [])
         if not subs:
             messagebox.showinfo("Attendance Report", "No subjects.")
             return
+        counts = compute_all_attendance(data)
         msg_lines = []
         for s in subs:
-            pct = compute_attendance_percent(s["id"])
+            pct = attendance_percent(counts, s["id"])
             status = "OK" if pct >= 75 else "LOW (<75%)"
             msg_lines.append(f"- {s['name']} ({s.get('code','')}) : {pct:.1f}% -> {status}")
         messagebox.showinfo("Attendance Report", "\n".join(msg_lines))
@@ -525,22 +749,28 @@ class PlannerApp(tk.Tk):
         frame = self.right_frame
         ttk.Label(frame, text="Assignments", font=("TkDefaultFont", 16, "bold")).pack(anchor=tk.W, pady=(10,6), padx=10)
 
-        data = load_data()
+        data = self._data_view()
         cols = ("#1", "#2", "#3", "#4")
         tree = ttk.Treeview(frame, columns=cols, show="headings", selectmode="browse")
         tree.heading("#1", text="Title")
         tree.heading("#2", text="Subject")
         tree.heading("#3", text="Due")
         tree.heading("#4", text="Status")
-        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
         self.content_widgets["assign_tree"] = tree
 
-        for a in data.get("assignments", []):
-            subj = next((s for s in data.get("subjects", []) if s["id"] == a.get("subjectId")), None)
-            subj_name = subj["name"] if subj else "No subject"
-            due_str = format_datetime_iso(a.get("dueAt"))
-            status_str = "Done" if a.get("completed") else "Pending"
-            tree.insert("", tk.END, iid=a["id"], values=(a["title"], subj_name, due_str, status_str))
+        # populate before packing so the widget is laid out once, not per insert
+        subj_by_id = subjects_by_id(data)
+
+        def assignment_rows():
+            for a in data.get("assignments", []):
+                subj = subj_by_id.get(a.get("subjectId"))
+                subj_name = subj["name"] if subj else "No subject"
+                due_str = format_datetime_iso(a.get("dueAt"))
+                status_str = "Done" if a.get("completed") else "Pending"
+                yield a["id"], (a["title"], subj_name, due_str, status_str)
+
+        self._populate_tree_lazy(tree, assignment_rows())
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
 
         btn_frame = ttk.Frame(frame)
         btn_frame.pack(fill=tk.X, padx=10, pady=6)
@@ -551,16 +781,13 @@ class PlannerApp(tk.Tk):
 
     def add_assignment_dialog(self):
         # choose subject optionally
-        data = load_data()
+        data = self._data_view()
         subs = data.get("subjects", [])
         subj_choice = None
         if subs:
-            choices = [f"{i+1}. {s['name']}" for i, s in enumerate(subs)]
-            sel = simpledialog.askstring("Assignment", "Select subject number (or leave blank for none):\n" + "\n".join(choices))
-            if sel and sel.isdigit():
-                n = int(sel)
-                if 1 <= n <= len(subs):
-                    subj_choice = subs[n-1]
+            ok, subj_choice = self._choose_subject_dialog("Assignment", subs, allow_none=True)
+            if not ok:
+                return
         title = simpledialog.askstring("Title", "Title:")
         if not title:
             messagebox.showerror("Input", "Title required.")
@@ -583,9 +810,15 @@ class PlannerApp(tk.Tk):
             "completed": False
         }
         data.setdefault("assignments", []).append(assignment)
-        save_data(data)
+        self._save(data)
         messagebox.showinfo("Assignment", "Added.")
-        self.show_assignments()
+        tree = self.content_widgets.get("assign_tree")
+        if tree is not None and tree.winfo_exists():
+            subj_name = subj_choice["name"] if subj_choice else "No subject"
+            tree.insert("", tk.END, iid=assignment["id"],
+                        values=(assignment["title"], subj_name, format_datetime_iso(assignment["dueAt"]), "Pending"))
+        else:
+            self.show_assignments()
 
     def toggle_assignment_completion(self):
         tree: ttk.Treeview = self.content_widgets.get("assign_tree")  # type: ignore
@@ -597,14 +830,17 @@ class PlannerApp(tk.Tk):
             messagebox.showinfo("Toggle", "Select an assignment.")
             return
         aid = sel[0]
-        data = load_data()
+        data = self._data_view()
         for a in data.get("assignments", []):
             if a["id"] == aid:
                 a["completed"] = not a.get("completed", False)
+                subj = subjects_by_id(data).get(a.get("subjectId"))
+                subj_name = subj["name"] if subj else "No subject"
+                status_str = "Done" if a["completed"] else "Pending"
+                tree.item(aid, values=(a["title"], subj_name, format_datetime_iso(a.get("dueAt")), status_str))
                 break
-        save_data(data)
+        self._save(data)
         messagebox.showinfo("Toggle", "Toggled status.")
-        self.show_assignments()
 
     def delete_assignment(self):
         tree: ttk.Treeview = self.content_widgets.get("assign_tree")  # type: ignore
@@ -616,30 +852,35 @@ class PlannerApp(tk.Tk):
             messagebox.showinfo("Delete", "Select an assignment.")
             return
         aid = sel[0]
-        data = load_data()
-        a = next((x for x in data.get("assignments", []) if x["id"] == aid), None)
-        if not a:
+        data = self._data_view()
+        assigns = data.get("assignments", [])
+        idx = next((i for i, x in enumerate(assigns) if x["id"] == aid), None)
+        if idx is None:
             messagebox.showerror("Delete", "Assignment not found.")
             return
-        if messagebox.askyesno("Confirm", f"Delete assignment '{a['title']}'?"):
-            data["assignments"] = [x for x in data.get("assignments", []) if x["id"] != aid]
-            save_data(data)
+        if messagebox.askyesno("Confirm", f"Delete assignment '{assigns[idx]['title']}'?"):
+            del assigns[idx]
+            self._save(data)
+            tree.delete(aid)
             messagebox.showinfo("Delete", "Deleted.")
-            self.show_assignments()
 
     def list_assignments(self, upcoming_days: int = 0):
-        data = load_data()
-        assigns = data.get("assignments", [])
-        now_dt = datetime.now()
+        data = self._data_view()
         if upcoming_days > 0:
-            window = now_dt + timedelta(days=upcoming_days)
-            assigns = [a for a in assigns if a.get("dueAt") and now_dt <= datetime.fromisoformat(a["dueAt"]) <= window]
+            now_dt = datetime.now()
+            keys, pairs = assignments_by_due(data)
+            lo = bisect_left(keys, now_dt)
+            hi = bisect_right(keys, now_dt + timedelta(days=upcoming_days))
+            assigns = [a for _, a in pairs[lo:hi]]  # already due-sorted
+        else:
+            assigns = sorted(data.get("assignments", []), key=lambda x: x.get("dueAt") or "")
         if not assigns:
             messagebox.showinfo("Assignments", "No assignments found.")
             return
         lines = []
-        for a in sorted(assigns, key=lambda x: x.get("dueAt") or ""):
-            subj = next((s for s in data.get("subjects", []) if s["id"] == a.get("subjectId")), None)
+        subj_by_id = subjects_by_id(data)
+        for a in assigns:
+            subj = subj_by_id.get(a.get("subjectId"))
             subj_name = subj["name"] if subj else "No subject"
             due_str = format_datetime_iso(a.get("dueAt"))
             status = "Done" if a.get("completed") else "Pending"
@@ -650,23 +891,38 @@ class PlannerApp(tk.Tk):
 
     # ---------- Misc ----------
     def get_todays_classes(self) -> List[Dict[str, Any]]:
-        data = load_data()
-        # use %a to get short weekday name like Mon, Tue
-        weekday_name = datetime.today().strftime("%a")
-        out = []
-        for s in data.get("subjects", []):
-            for slot in s.get("schedule", []):
-                if slot.get("day") == weekday_name:
-                    out.append({"subject": s, "slot": slot})
-        return out
+        data = self._data_view()
+        # index into WEEKDAYS instead of strftime: cheaper and locale-independent
+        weekday_name = WEEKDAYS[(date.today().weekday() + 1) % 7]
+        return [
+            {"subject": s, "slot": slot}
+            for s in data.get("subjects", [])
+            for slot in s.get("schedule", ())
+            if slot.get("day") == weekday_name
+        ]
 
     def export_data(self):
         target = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")], initialfile=f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
         if not target:
             return
-        data = load_data()
-        with open(target, "w") as f:
-            json.dump(data, f, indent=2)
+        # serialize here, before any handler can mutate the live dict; only
+        # the file write goes to the worker
+        payload = _dumps(self._data_view())
+
+        def _write():
+            with open(target, "wb") as f:
+                f.write(payload)
+            return target
+
+        fut = self._io_pool.submit(_write)
+        fut.add_done_callback(lambda f: self.after(0, self._export_done, f))
+
+    def _export_done(self, fut):
+        try:
+            target = fut.result()
+        except Exception as e:
+            messagebox.showerror("Export", f"Export failed: {e}")
+            return
         messagebox.showinfo("Export", f"Exported to {target}")
 
     def import_data(self):
@@ -678,16 +934,37 @@ class PlannerApp(tk.Tk):
             return
         if not messagebox.askyesno("Confirm Import", "Import will replace current data.json (a backup will be created). Continue?"):
             return
-        backup_data()
-        with open(fname, "r") as f:
-            payload = json.load(f)
-        save_data(payload)
+
+        def _do_import():
+            backup_data()
+            with open(fname, "rb") as f:
+                return _loads(f.read())
+
+        fut = self._io_pool.submit(_do_import)
+        fut.add_done_callback(lambda f: self.after(0, self._import_done, f))
+
+    def _import_done(self, fut):
+        try:
+            payload = fut.result()
+        except Exception as e:
+            messagebox.showerror("Import", f"Import failed: {e}")
+            return
+        # save on the Tk thread: _save touches the module cache and self._data
+        self._save(payload)
         messagebox.showinfo("Import", "Imported data and backed up previous data.json")
         # refresh UI if needed
         self.show_dashboard()
 
     def backup_now(self):
-        dest = backup_data()
+        fut = self._io_pool.submit(backup_data)
+        fut.add_done_callback(lambda f: self.after(0, self._backup_done, f))
+
+    def _backup_done(self, fut):
+        try:
+            dest = fut.result()
+        except Exception as e:
+            messagebox.showerror("Backup", f"Backup failed: {e}")
+            return
         messagebox.showinfo("Backup", f"Backup created at {dest}")
         self._refresh_backups()
 
@@ -700,7 +977,7 @@ class PlannerApp(tk.Tk):
         ]
         data = {"subjects": demo_subs, "attendance": [], "assignments": [], "meta": {"createdAt": now_iso()}}
         backup_data()
-        save_data(data)
+        self._save(data)
         messagebox.showinfo("Demo", "Demo data created (previous data backed up).")
         self.show_dashboard()
         self._refresh_backups()
@@ -9,22 +9,41 @@ import json
 import os
 import shutil
 import sys
-import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from typing import Any, Dict, List, Optional
 
 DATA_FILE = "data.json"
 BACKUP_DIR = "backups"
+MAX_BACKUPS = 50  # oldest snapshots beyond this are pruned on each backup
 WEEKDAYS = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
 DATE_FMT = "%Y-%m-%d"
 DATETIME_FMT = "%Y-%m-%d %H:%M"
 
 # ---------- Terminal helpers ----------
+# detect once: everything but legacy cmd.exe understands the ANSI clear
+# sequence, and emitting it directly avoids a fork/exec per menu transition
+_ANSI_CLEAR = os.name != "nt" or bool(os.environ.get("WT_SESSION") or os.environ.get("ANSICON"))
+
 def clear_screen():
-    os.system("cls" if os.name == "nt" else "clear")
+    if _ANSI_CLEAR:
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+    else:
+        os.system("cls")
+
+# prefix strings are cached per code so hot list renders don't re-run the
+# f-string formatting for every line
+_RESET = "\033[0m"
+_PREFIX: Dict[str, str] = {}
+CYAN_BOLD = "\033[1;36m"
 
 def color(text, code):
-    return f"\033[{code}m{text}\033[0m"
+    prefix = _PREFIX.get(code)
+    if prefix is None:
+        prefix = _PREFIX.setdefault(code, f"\033[{code}m")
+    return prefix + text + _RESET
 
 def header(title):
     clear_screen()
@@ -40,30 +59,105 @@ def now_iso():
     return datetime.now().isoformat()
 
 # ---------- Storage ----------
+# Prefer orjson when it happens to be installed (much faster encode/decode);
+# fall back to the stdlib so the script still runs with no dependencies.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(o) -> bytes:
+        return orjson.dumps(o, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(o) -> bytes:
+        return json.dumps(o, indent=2).encode()
+
+# ijson lets the attendance report stream just the sections it needs instead
+# of materializing the whole document; purely optional.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Every menu action re-read and re-parsed data.json; cache the parsed dict
+# keyed on (mtime_ns, size) and hand back the same object while the file is
+# unchanged. save_data() refreshes the cache so in-process writes stay hits.
+# "due_index" (parsed dueAt datetimes) and "by_weekday" (schedule slots
+# grouped by day) are derived from the cached data and dropped whenever the
+# data changes.
+_CACHE = {"stat": None, "data": None, "due_index": None, "by_weekday": None}
+
 def ensure_data_file():
     if not os.path.exists(DATA_FILE):
         init = {"subjects": [], "attendance": [], "assignments": [], "meta": {"createdAt": now_iso()}}
-        with open(DATA_FILE, "w") as f:
-            json.dump(init, f, indent=2)
+        with open(DATA_FILE, "wb") as f:
+            f.write(_dumps(init))
 
 def load_data() -> Dict[str, Any]:
     ensure_data_file()
-    with open(DATA_FILE, "r") as f:
-        return json.load(f)
+    st = os.stat(DATA_FILE)
+    key = (st.st_mtime_ns, st.st_size)
+    if _CACHE["stat"] == key:
+        return _CACHE["data"]
+    # slurp then parse: one contiguous buffer for the C parser instead of
+    # json.load's chunked reads through the file object
+    with open(DATA_FILE, "rb") as f:
+        data = _loads(f.read())
+    _CACHE["stat"] = key
+    _CACHE["data"] = data
+    _CACHE["due_index"] = None
+    _CACHE["by_weekday"] = None
+    return data
 
 def save_data(d: Dict[str, Any]):
-    with open(DATA_FILE, "w") as f:
-        json.dump(d, f, indent=2)
+    # serialize once, write+fsync a temp file, then atomically swap it in so
+    # a crash mid-save can never leave data.json truncated
+    buf = _dumps(d)
+    tmp = DATA_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(buf)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, DATA_FILE)
+    st = os.stat(DATA_FILE)
+    _CACHE["stat"] = (st.st_mtime_ns, st.st_size)
+    _CACHE["data"] = d
+    _CACHE["due_index"] = None
+    _CACHE["by_weekday"] = None
 
 def backup_data():
     os.makedirs(BACKUP_DIR, exist_ok=True)
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     dest = os.path.join(BACKUP_DIR, f"data_backup_{ts}.json")
-    shutil.copy2(DATA_FILE, dest)
+    # hardlink: zero bytes copied. save_data's os.replace swaps in a new
+    # inode, so the link keeps pointing at the old contents — a free
+    # snapshot. Fall back to a copy where linking isn't possible.
+    try:
+        os.link(DATA_FILE, dest)
+    except FileExistsError:
+        # second backup within the same timestamp; refresh it unless it is
+        # already a link to the current data (copying onto the shared inode
+        # would raise SameFileError)
+        if not os.path.samefile(DATA_FILE, dest):
+            tmp = dest + ".tmp"
+            shutil.copyfile(DATA_FILE, tmp)
+            os.replace(tmp, dest)
+    except OSError:
+        shutil.copy2(DATA_FILE, dest)
+    # rotate so backups/ doesn't grow without bound (a backup happens on
+    # every import); timestamped names sort chronologically
+    with os.scandir(BACKUP_DIR) as it:
+        snapshots = sorted(e.path for e in it if e.name.startswith("data_backup_") and e.name.endswith(".json"))
+    for old in snapshots[:-MAX_BACKUPS]:
+        os.remove(old)
     return dest
 
 def gen_id():
-    return uuid.uuid4().hex[:10]
+    # same getrandom() syscall uuid4 ends up making, minus the UUID object
+    # construction; 10 hex chars of entropy as before
+    return os.urandom(5).hex()
 
 # ---------- Utilities ----------
 def parse_schedule_string(s: str):
@@ -86,6 +180,27 @@ def parse_schedule_string(s: str):
             raise ValueError("Bad schedule piece. Example: Mon@09:00-10:30")
     return items
 
+def subjects_by_id(d: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return {s["id"]: s for s in d.get("subjects", [])}
+
+def assignments_with_due(d: Dict[str, Any]):
+    """(parsed dueAt or None, assignment) pairs, kept alongside the data
+    cache so ISO parsing happens only when data.json actually changes."""
+    if d is _CACHE["data"] and _CACHE["due_index"] is not None:
+        return _CACHE["due_index"]
+    pairs = []
+    for a in d.get("assignments", []):
+        due = None
+        if a.get("dueAt"):
+            try:
+                due = datetime.fromisoformat(a["dueAt"])
+            except Exception:
+                due = None
+        pairs.append((due, a))
+    if d is _CACHE["data"]:
+        _CACHE["due_index"] = pairs
+    return pairs
+
 def format_datetime_iso(s: Optional[str]):
     if not s:
         return "N/A"
@@ -137,18 +252,22 @@ def list_subjects(show_ids: bool = True):
     if not subs:
         print(color("No subjects found. Add one from the menu.", "1;33"))
     else:
+        # collect lines and emit once: one stdout write instead of one
+        # lock/flush cycle per print
+        out = []
         for i, s in enumerate(subs, start=1):
             line = f"{i}. {s['name']}" + (f" [{s.get('code')}]" if s.get('code') else "")
             if show_ids:
                 line += f" (id:{s['id']})"
-            print(color(line, "1;36"))
+            out.append(CYAN_BOLD + line + _RESET)
             if s.get("prof"):
-                print(f"   Prof: {s['prof']}")
+                out.append(f"   Prof: {s['prof']}")
             if s.get("schedule"):
                 for sch in s["schedule"]:
                     loc = f" @ {sch['location']}" if sch.get("location") else ""
-                    print(f"   - {sch['day']} {sch['start']}-{sch['end']}{loc}")
-            print()
+                    out.append(f"   - {sch['day']} {sch['start']}-{sch['end']}{loc}")
+            out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
     pause()
 
 def choose_subject(prompt: str) -> Optional[Dict[str, Any]]:
@@ -197,23 +316,56 @@ def record_attendance():
     print(color(f"Recorded {'Present' if present else 'Absent'} for {subj['name']} on {d.isoformat()}", "1;32"))
     pause()
 
-def compute_attendance_percent(subject_id: str) -> float:
-    d = load_data()
-    rows = [r for r in d.get("attendance", []) if r["subjectId"] == subject_id]
-    if not rows:
+def attendance_by_subject(d: Dict[str, Any]) -> Dict[str, List[int]]:
+    """One pass over attendance: {subjectId: [present_count, total]}."""
+    out: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    for r in d.get("attendance", []):
+        c = out[r["subjectId"]]
+        c[0] += r["present"]
+        c[1] += 1
+    return out
+
+def attendance_percent(counts: Dict[str, List[int]], subject_id: str) -> float:
+    present, total = counts.get(subject_id, (0, 0))
+    if total == 0:
         return 100.0
-    present = sum(1 for r in rows if r["present"])
-    return (present / len(rows)) * 100.0
+    return (present / total) * 100.0
+
+def compute_attendance_percent(subject_id: str, data: Optional[Dict[str, Any]] = None) -> float:
+    """Percent present for one subject. Pass the already-loaded `data` when
+    calling in a loop so each call doesn't go back through load_data()."""
+    d = data if data is not None else load_data()
+    return attendance_percent(attendance_by_subject(d), subject_id)
+
+def _report_sections():
+    """Subjects plus per-subject attendance tallies for the report.
+
+    With ijson installed and a cold cache, streams only the two sections it
+    needs — the attendance list is tallied on the fly and never materialized.
+    Otherwise falls back to the normal (cached) loader.
+    """
+    if ijson is not None and _CACHE["data"] is None:
+        ensure_data_file()
+        counts: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        with open(DATA_FILE, "rb") as f:
+            for r in ijson.items(f, "attendance.item"):
+                c = counts[r["subjectId"]]
+                c[0] += bool(r["present"])
+                c[1] += 1
+        with open(DATA_FILE, "rb") as f:
+            subs = list(ijson.items(f, "subjects.item"))
+        return subs, counts
+    d = load_data()
+    return d.get("subjects", []), attendance_by_subject(d)
 
 def attendance_report():
     header("Attendance Report")
-    d = load_data()
-    subs = d.get("subjects", [])
+    subs, counts = _report_sections()
     if not subs:
         print(color("No subjects.", "1;33"))
     else:
         for s in subs:
-            pct = compute_attendance_percent(s["id"])
+            pct = attendance_percent(counts, s["id"])
             status = color("OK", "1;32") if pct >= 75 else color("LOW (<75%)", "1;31")
             print(f"- {s['name']} ({s.get('code','')}) : {pct:.1f}% -> {status}")
     pause()
@@ -255,24 +407,29 @@ def add_assignment():
 def list_assignments(upcoming_days: int = 0):
     header("Assignments")
     data = load_data()
-    assigns = data.get("assignments", [])
+    pairs = assignments_with_due(data)
     now = datetime.now()
     if upcoming_days > 0:
         window = now + timedelta(days=upcoming_days)
-        assigns = [a for a in assigns if a.get("dueAt") and now <= datetime.fromisoformat(a["dueAt"]) <= window]
-    if not assigns:
+        pairs = [(due, a) for due, a in pairs if due and now <= due <= window]
+    if not pairs:
         print(color("No assignments found.", "1;33"))
     else:
-        for a in sorted(assigns, key=lambda x: x.get("dueAt") or ""):
-            subj = next((s for s in data.get("subjects", []) if s["id"] == a.get("subjectId")), None)
+        # collect lines and emit once: one stdout write instead of one
+        # lock/flush cycle per print
+        out = []
+        subj_by_id = subjects_by_id(data)
+        for due, a in sorted(pairs, key=lambda x: x[0] or datetime.max):
+            subj = subj_by_id.get(a.get("subjectId"))
             subj_name = subj["name"] if subj else "No subject"
             due_str = format_datetime_iso(a.get("dueAt"))
             status = color("Done", "1;32") if a.get("completed") else color("Pending", "1;33")
-            print(color(f"- {a['title']} [{subj_name}] (id:{a['id']})", "1;36"))
-            print(f"   Due: {due_str}   Status: {status}")
+            out.append(CYAN_BOLD + f"- {a['title']} [{subj_name}] (id:{a['id']})" + _RESET)
+            out.append(f"   Due: {due_str}   Status: {status}")
             if a.get("description"):
-                print(f"   {a['description']}")
-            print()
+                out.append(f"   {a['description']}")
+            out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
     pause()
 
 def toggle_assignment_completion():
@@ -283,8 +440,13 @@ def toggle_assignment_completion():
         print(color("No assignments.", "1;33"))
         pause()
         return
+    subj_by_id = subjects_by_id(data)
+    # remember which id was shown under each number so the toggle targets the
+    # record the user saw, independent of storage order
+    idx_to_id = {}
     for i, a in enumerate(assigns, start=1):
-        subj = next((s for s in data.get("subjects", []) if s["id"] == a.get("subjectId")), None)
+        idx_to_id[i] = a["id"]
+        subj = subj_by_id.get(a.get("subjectId"))
         subj_name = subj["name"] if subj else "No subject"
         status = "Done" if a.get("completed") else "Pending"
         print(f"{i}. {a['title']} [{subj_name}] - {status}")
@@ -294,56 +456,71 @@ def toggle_assignment_completion():
         pause()
         return
     n = int(choice)
-    if n < 1 or n > len(assigns):
+    target_id = idx_to_id.get(n)
+    if target_id is None:
         print(color("Out of range.", "1;31"))
         pause()
         return
-    assigns[n-1]["completed"] = not assigns[n-1].get("completed", False)
+    for a in assigns:
+        if a["id"] == target_id:
+            a["completed"] = not a.get("completed", False)
+            break
     save_data(data)
     print(color("Toggled assignment status.", "1;32"))
     pause()
 
+def classes_by_weekday(d: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Schedule slots grouped by weekday, cached alongside the data."""
+    if d is _CACHE["data"] and _CACHE["by_weekday"] is not None:
+        return _CACHE["by_weekday"]
+    by_day: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for s in d.get("subjects", []):
+        for slot in s.get("schedule", ()):
+            by_day[slot.get("day")].append({"subject": s, "slot": slot})
+    if d is _CACHE["data"]:
+        _CACHE["by_weekday"] = by_day
+    return by_day
+
 def get_todays_classes():
     data = load_data()
     weekday_name = WEEKDAYS[(date.today().weekday() + 1) % 7]
-    out = []
-    for s in data.get("subjects", []):
-        for slot in s.get("schedule", []):
-            if slot.get("day") == weekday_name:
-                out.append({"subject": s, "slot": slot})
-    return out
+    return classes_by_weekday(data).get(weekday_name, [])
 
 def dashboard():
     header("Dashboard")
     data = load_data()
+    subj_by_id = subjects_by_id(data)
+    weekday_name = WEEKDAYS[(date.today().weekday() + 1) % 7]
+    # gather everything first: one attendance scan, one subjects scan that
+    # collects today's slots and alerts together, one assignment filter
+    counts = attendance_by_subject(data)
+    classes = []
+    alerts = []
+    for s in data.get("subjects", []):
+        for slot in s.get("schedule", ()):
+            if slot.get("day") == weekday_name:
+                classes.append((s, slot))
+        pct = attendance_percent(counts, s["id"])
+        if pct < 75.0:
+            alerts.append((s, pct))
+    now = datetime.now()
+    window = now + timedelta(days=7)
+    upcoming = [(due, a) for due, a in assignments_with_due(data) if due and now <= due <= window]
+    upcoming.sort(key=lambda x: x[0])
     # Today's classes
-    classes = get_todays_classes()
     if classes:
         print(color("Today's classes:", "1;33"))
-        for c in classes:
-            s = c["subject"]
-            slot = c["slot"]
+        for s, slot in classes:
             loc = f" @ {slot['location']}" if slot.get("location") else ""
             print(f"- {s['name']} {slot['start']}-{slot['end']}{loc}")
     else:
         print(color("No classes scheduled for today.", "1;33"))
     print()
     # Upcoming assignments (7 days)
-    now = datetime.now()
-    upcoming = []
-    for a in data.get("assignments", []):
-        if a.get("dueAt"):
-            try:
-                d = datetime.fromisoformat(a["dueAt"])
-            except Exception:
-                continue
-            if now <= d <= now + timedelta(days=7):
-                upcoming.append((d,a))
-    upcoming.sort(key=lambda x: x[0])
     if upcoming:
         print(color("Upcoming assignments (next 7 days):", "1;33"))
         for d,a in upcoming:
-            subj = next((s for s in data.get("subjects", []) if s["id"] == a.get("subjectId")), None)
+            subj = subj_by_id.get(a.get("subjectId"))
             subj_name = subj["name"] if subj else "No subject"
             print(f"- {a['title']} [{subj_name}] due {d.strftime(DATETIME_FMT)}")
     else:
@@ -351,11 +528,6 @@ def dashboard():
     print()
     # Attendance alerts
     print(color("Attendance alerts (below 75%):", "1;33"))
-    alerts = []
-    for s in data.get("subjects", []):
-        pct = compute_attendance_percent(s["id"])
-        if pct < 75.0:
-            alerts.append((s,pct))
     if alerts:
         for s,pct in alerts:
             print(f"- {s['name']}: {pct:.1f}% (Below 75%)")
@@ -369,8 +541,11 @@ def export_data():
     target = input("Filename to export to [default export_<timestamp>.json]: ").strip()
     if not target:
         target = f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    # stream chunk-by-chunk: peak memory stays ~1x the document instead of
+    # holding the fully serialized string next to the data
     with open(target, "w") as f:
-        json.dump(data, f, indent=2)
+        for chunk in json.JSONEncoder(indent=2).iterencode(data):
+            f.write(chunk)
     print(color(f"Exported to {target}", "1;32"))
     pause()
 
@@ -381,9 +556,13 @@ def import_data():
         print(color("File not found.", "1;31"))
         pause()
         return
-    backup_data()
-    with open(fname, "r") as f:
-        payload = json.load(f)
+    # overlap the backup of the old data.json with reading+parsing the
+    # import payload; both must be done before the new data is written
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        backup_fut = pool.submit(backup_data)
+        with open(fname, "rb") as f:
+            payload = _loads(f.read())
+        backup_fut.result()
     save_data(payload)
     print(color("Imported data and backed up previous data.json", "1;32"))
     pause()